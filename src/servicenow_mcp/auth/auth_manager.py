@@ -5,6 +5,7 @@ Authentication manager for the ServiceNow MCP server.
 import base64
 import logging
 import os
+import threading
 from typing import Dict, Optional
 
 import requests
@@ -36,6 +37,9 @@ class AuthManager:
         self.instance_url = instance_url
         self.token: Optional[str] = None
         self.token_type: Optional[str] = None
+        # Tools run concurrently on worker threads, so only one of them may
+        # fetch a token while the others wait for it.
+        self._token_lock = threading.Lock()
     
     def get_headers(self) -> Dict[str, str]:
         """
@@ -58,10 +62,12 @@ class AuthManager:
             headers["Authorization"] = f"Basic {encoded}"
         
         elif self.config.type == AuthType.OAUTH:
-            if not self.token:
-                self._get_oauth_token()
+            with self._token_lock:
+                if not self.token:
+                    self._get_oauth_token()
+                token_type, token = self.token_type, self.token
             
-            headers["Authorization"] = f"{self.token_type} {self.token}"
+            headers["Authorization"] = f"{token_type} {token}"
         
         elif self.config.type == AuthType.API_KEY:
             if not self.config.api_key:
@@ -167,4 +173,5 @@ class AuthManager:
     def refresh_token(self):
         """Refresh the OAuth token if using OAuth authentication."""
         if self.config.type == AuthType.OAUTH:
-            self._get_oauth_token()
+            with self._token_lock:
+                self._get_oauth_token()
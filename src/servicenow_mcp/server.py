@@ -4,6 +4,7 @@ ServiceNow MCP Server
 This module provides the main implementation of the ServiceNow MCP server.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -272,9 +273,10 @@ class ServiceNowMCP:
             )
             raise ValueError(f"Failed to parse arguments for tool '{name}': {e}")
 
-        # Execute the tool implementation function
+        # Execute the tool implementation function on a worker thread so that
+        # the event loop can serve other requests while ServiceNow responds
         try:
-            result = impl_func(self.config, self.auth_manager, params)
+            result = await asyncio.to_thread(impl_func, self.config, self.auth_manager, params)
             logger.debug(f"Raw result type from tool '{name}': {type(result)}")
         except Exception as e:
             logger.error(f"Error executing tool '{name}': {e}", exc_info=True)
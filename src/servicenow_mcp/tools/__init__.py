@@ -41,6 +41,7 @@ from servicenow_mcp.tools.changeset_tools import (
 )
 from servicenow_mcp.tools.incident_tools import (
     add_comment,
+    batch_update_incidents,
     create_incident,
     list_incidents,
     resolve_incident,
@@ -122,6 +123,7 @@ __all__ = [
     "add_comment",
     "resolve_incident",
     "list_incidents",
+    "batch_update_incidents",
     
     # Catalog tools
     "list_catalog_items",
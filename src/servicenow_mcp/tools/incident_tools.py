@@ -4,17 +4,282 @@ Incident tools for the ServiceNow MCP server.
 This module provides tools for managing incidents in ServiceNow.
 """
 
+import base64
+import functools
+import json
 import logging
-from typing import Optional, List
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from http.cookiejar import DefaultCookiePolicy
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Optional, ParamSpec, Tuple, Union
+from urllib.parse import urlencode
 
 import requests
 from pydantic import BaseModel, Field
+from pydantic_core import from_json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
 
 logger = logging.getLogger(__name__)
 
+P = ParamSpec("P")
+
+# A sys_id is 32 lowercase hex characters; anything else is treated as a number.
+_SYS_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+# Cache of resolved incident number -> sys_id lookups, keyed by
+# (api_url, number). Entries expire so renumbered or deleted records are
+# eventually looked up again.
+_SYS_ID_CACHE_SIZE = 4096
+_SYS_ID_CACHE_TTL = 300
+_sys_id_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+_sys_id_cache_lock = threading.Lock()
+
+# Incident columns read by _format_incident. Only these are requested so the
+# response does not carry (and we do not parse) the rest of every record.
+_LIST_FIELDS = (
+    "sys_id",
+    "number",
+    "short_description",
+    "description",
+    "state",
+    "priority",
+    "assigned_to",
+    "category",
+    "subcategory",
+    "sys_created_on",
+    "sys_updated_on",
+)
+
+# Query parameters sent with every list_incidents page request.
+_BASE_LIST_QUERY_PARAMS = MappingProxyType(
+    {
+        "sysparm_display_value": "true",
+        "sysparm_exclude_reference_link": "true",
+        "sysparm_fields": ",".join(_LIST_FIELDS),
+    }
+)
+
+# ListIncidentsParams attributes that map to an exact-match filter on the
+# incident column of the same name.
+_LIST_FILTER_FIELDS = (
+    ("state", "state"),
+    ("assigned_to", "assigned_to"),
+    ("category", "category"),
+)
+
+# Incident columns written by create_incident and update_incident. Each is an
+# optional string parameter of the same name that is sent only when set.
+_CREATE_FIELDS: Tuple[str, ...] = (
+    "short_description",
+    "description",
+    "caller_id",
+    "category",
+    "subcategory",
+    "priority",
+    "impact",
+    "urgency",
+    "assigned_to",
+    "assignment_group",
+)
+_UPDATE_FIELDS: Tuple[str, ...] = (
+    "short_description",
+    "description",
+    "state",
+    "category",
+    "subcategory",
+    "priority",
+    "impact",
+    "urgency",
+    "assigned_to",
+    "assignment_group",
+    "work_notes",
+    "close_notes",
+    "close_code",
+)
+
+# Incident numbers resolved per lookup request in a batch update, keeping the
+# numberIN query well under instance and proxy URL-length limits.
+_BATCH_LOOKUP_SIZE = 100
+
+# Headers sent with every sub-request of a Batch API call.
+_BATCH_HEADERS = [
+    {"name": "Content-Type", "value": "application/json"},
+    {"name": "Accept", "value": "application/json"},
+]
+
+# Shared HTTP session so repeated calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP/TLS handshake on every request.
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for incident API calls.
+
+    The session is created lazily on first use and mounts a pooled adapter
+    that retries GET requests on transient ServiceNow errors, so one lookup
+    can take up to four times the configured timeout plus backoff. Writes are
+    never retried. It keeps connections only; cookies are never stored.
+
+    Returns:
+        The shared requests session.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=10,
+                    # Tools run on asyncio.to_thread's default executor (at
+                    # most 32 workers), so every concurrent call gets its own
+                    # kept-alive connection instead of a new handshake.
+                    pool_maxsize=50,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.2,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        # A PUT that timed out or hit a 502 may already have
+                        # been applied, and comments/work_notes are journal
+                        # fields, so resending would post the entry twice.
+                        allowed_methods=frozenset({"GET"}),
+                        # ServiceNow rate limits can send Retry-After values
+                        # close to an hour; sleeping that long would stall
+                        # the server, so only the short backoff is used.
+                        respect_retry_after_header=False,
+                    ),
+                )
+                session = requests.Session()
+                # The session is shared by every config and credential set, so
+                # ServiceNow session cookies must not carry over between calls.
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """
+    Parse a ServiceNow JSON response body.
+
+    Uses pydantic-core's parser, which is faster than the standard library on
+    large result lists and caches the keys repeated in every record.
+
+    Args:
+        response: Response to parse.
+
+    Returns:
+        The parsed JSON body.
+
+    Raises:
+        requests.exceptions.InvalidJSONError: If the body is not valid JSON.
+    """
+    try:
+        return from_json(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response) from e
+
+
+def _is_sys_id(incident_id: str) -> bool:
+    """Check whether an incident identifier looks like a sys_id rather than a number."""
+    return _SYS_ID_PATTERN.fullmatch(incident_id) is not None
+
+
+def _get_cached_sys_id(api_url: str, number: str) -> Optional[str]:
+    """Get a cached sys_id for an incident number, if present and not expired."""
+    key = (api_url, number.upper())
+    with _sys_id_cache_lock:
+        entry = _sys_id_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, sys_id = entry
+        if expires_at < time.monotonic():
+            del _sys_id_cache[key]
+            return None
+        _sys_id_cache.move_to_end(key)
+        return sys_id
+
+
+def _cache_sys_id(api_url: str, number: str, sys_id: str) -> None:
+    """Remember the sys_id for an incident number."""
+    key = (api_url, number.upper())
+    with _sys_id_cache_lock:
+        _sys_id_cache[key] = (time.monotonic() + _SYS_ID_CACHE_TTL, sys_id)
+        _sys_id_cache.move_to_end(key)
+        while len(_sys_id_cache) > _SYS_ID_CACHE_SIZE:
+            _sys_id_cache.popitem(last=False)
+
+
+def _evict_sys_id(api_url: str, number: str) -> None:
+    """Forget the cached sys_id for an incident number."""
+    with _sys_id_cache_lock:
+        _sys_id_cache.pop((api_url, number.upper()), None)
+
+
+def _resolve_sys_id(
+    config: ServerConfig,
+    headers: Dict[str, str],
+    incident_id: str,
+) -> Optional[str]:
+    """
+    Resolve an incident number or sys_id to a sys_id.
+
+    Values that already look like a sys_id are returned as-is. Incident
+    numbers are looked up in ServiceNow and cached, so repeated operations on
+    the same incident only pay for the lookup once.
+
+    Args:
+        config: Server configuration.
+        headers: Authentication headers for the request.
+        incident_id: Incident number or sys_id.
+
+    Returns:
+        The sys_id of the incident, or None if no incident has that number.
+
+    Raises:
+        requests.RequestException: If the lookup request fails.
+    """
+    if _is_sys_id(incident_id):
+        return incident_id
+
+    sys_id = _get_cached_sys_id(config.api_url, incident_id)
+    if sys_id:
+        return sys_id
+
+    # Only the sys_id is needed, so skip the rest of the record
+    query_params: Dict[str, Any] = {
+        "sysparm_query": f"number={incident_id}",
+        "sysparm_limit": 1,
+        "sysparm_fields": "sys_id",
+        "sysparm_exclude_reference_link": "true",
+    }
+
+    response = _get_session().get(
+        f"{config.api_url}/table/incident",
+        params=query_params,
+        headers=headers,
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
+
+    result: List[Dict[str, str]] = _parse_json(response).get("result", [])
+    if not result:
+        return None
+
+    sys_id = result[0].get("sys_id")
+    if sys_id:
+        _cache_sys_id(config.api_url, incident_id, sys_id)
+    return sys_id
+
 
 class CreateIncidentParams(BaseModel):
     """Parameters for creating an incident."""
@@ -77,6 +342,14 @@ class ListIncidentsParams(BaseModel):
     query: Optional[str] = Field(None, description="Search query for incidents")
 
 
+class BatchUpdateIncidentsParams(BaseModel):
+    """Parameters for updating several incidents in one batch."""
+
+    updates: List[UpdateIncidentParams] = Field(
+        ..., description="Incident updates to apply, each with its own incident ID or sys_id"
+    )
+
+
 class IncidentResponse(BaseModel):
     """Response from incident operations."""
 
@@ -86,6 +359,140 @@ class IncidentResponse(BaseModel):
     incident_number: Optional[str] = Field(None, description="Number of the affected incident")
 
 
+def _handle_request_errors(
+    action: str,
+) -> Callable[[Callable[P, IncidentResponse]], Callable[P, IncidentResponse]]:
+    """
+    Report request failures of an incident tool as a failed IncidentResponse.
+
+    Only the GET lookups are retried by the shared session's adapter; a
+    failed POST or PUT reaches this wrapper on its first failure, since
+    resending it could create or journal the same change twice.
+
+    Args:
+        action: Description of the operation, used in the error message.
+
+    Returns:
+        Decorator for functions returning an IncidentResponse.
+    """
+
+    def decorator(func: Callable[P, IncidentResponse]) -> Callable[P, IncidentResponse]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> IncidentResponse:
+            try:
+                return func(*args, **kwargs)
+            except requests.RequestException as e:
+                logger.error(f"Failed to {action}: {e}")
+                return IncidentResponse(
+                    success=False,
+                    message=f"Failed to {action}: {str(e)}",
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def _resolve_incident_url(
+    config: ServerConfig,
+    headers: Dict[str, str],
+    incident_id: str,
+) -> Union[str, IncidentResponse]:
+    """
+    Resolve an incident number or sys_id to its Table API record URL.
+
+    Args:
+        config: Server configuration.
+        headers: Authentication headers for the request.
+        incident_id: Incident number or sys_id.
+
+    Returns:
+        The record URL, or a failed IncidentResponse if the incident could not
+        be found.
+    """
+    try:
+        sys_id = _resolve_sys_id(config, headers, incident_id)
+    except requests.RequestException as e:
+        logger.error(f"Failed to find incident: {e}")
+        return IncidentResponse(
+            success=False,
+            message=f"Failed to find incident: {str(e)}",
+        )
+
+    if not sys_id:
+        return IncidentResponse(
+            success=False,
+            message=f"Incident not found: {incident_id}",
+        )
+
+    return f"{config.api_url}/table/incident/{sys_id}"
+
+
+def _put_incident(
+    config: ServerConfig,
+    headers: Dict[str, str],
+    incident_id: str,
+    data: Dict[str, Any],
+) -> Union[Dict[str, Any], IncidentResponse]:
+    """
+    Update an incident record by number or sys_id.
+
+    A 404 for an incident number means the cached sys_id belongs to a deleted
+    or re-created incident, so the number is looked up again once. Nothing was
+    written by the failed request, so repeating it cannot apply a change twice.
+
+    Args:
+        config: Server configuration.
+        headers: Authentication headers for the request.
+        incident_id: Incident number or sys_id.
+        data: Incident fields to update.
+
+    Returns:
+        The updated record, or a failed IncidentResponse if the incident could
+        not be found.
+
+    Raises:
+        requests.RequestException: If the update request fails.
+    """
+    for attempt in range(2):
+        api_url = _resolve_incident_url(config, headers, incident_id)
+        if isinstance(api_url, IncidentResponse):
+            return api_url
+
+        response = _get_session().put(
+            api_url,
+            json=data,
+            headers=headers,
+            timeout=config.timeout,
+        )
+        if response.status_code == 404 and not _is_sys_id(incident_id):
+            _evict_sys_id(config.api_url, incident_id)
+            if attempt == 0:
+                continue
+        break
+
+    response.raise_for_status()
+
+    result: Dict[str, Any] = _parse_json(response).get("result", {})
+    return result
+
+
+def _build_update_data(params: UpdateIncidentParams) -> Dict[str, Any]:
+    """
+    Build the request body for an incident update.
+
+    Args:
+        params: Parameters for updating the incident.
+
+    Returns:
+        Dictionary of the incident fields to update.
+    """
+    return {
+        field: value for field in _UPDATE_FIELDS if (value := getattr(params, field)) is not None
+    }
+
+
+@_handle_request_errors("create incident")
 def create_incident(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -106,55 +513,29 @@ def create_incident(
 
     # Build request data
     data = {
-        "short_description": params.short_description,
+        field: value for field in _CREATE_FIELDS if (value := getattr(params, field)) is not None
     }
 
-    if params.description:
-        data["description"] = params.description
-    if params.caller_id:
-        data["caller_id"] = params.caller_id
-    if params.category:
-        data["category"] = params.category
-    if params.subcategory:
-        data["subcategory"] = params.subcategory
-    if params.priority:
-        data["priority"] = params.priority
-    if params.impact:
-        data["impact"] = params.impact
-    if params.urgency:
-        data["urgency"] = params.urgency
-    if params.assigned_to:
-        data["assigned_to"] = params.assigned_to
-    if params.assignment_group:
-        data["assignment_group"] = params.assignment_group
-
     # Make request
-    try:
-        response = requests.post(
-            api_url,
-            json=data,
-            headers=auth_manager.get_headers(),
-            timeout=config.timeout,
-        )
-        response.raise_for_status()
-
-        result = response.json().get("result", {})
+    response = _get_session().post(
+        api_url,
+        json=data,
+        headers=auth_manager.get_headers(),
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
 
-        return IncidentResponse(
-            success=True,
-            message="Incident created successfully",
-            incident_id=result.get("sys_id"),
-            incident_number=result.get("number"),
-        )
+    result: Dict[str, Any] = _parse_json(response).get("result", {})
 
-    except requests.RequestException as e:
-        logger.error(f"Failed to create incident: {e}")
-        return IncidentResponse(
-            success=False,
-            message=f"Failed to create incident: {str(e)}",
-        )
+    return IncidentResponse(
+        success=True,
+        message="Incident created successfully",
+        incident_id=result.get("sys_id"),
+        incident_number=result.get("number"),
+    )
 
 
+@_handle_request_errors("update incident")
 def update_incident(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -171,103 +552,26 @@ def update_incident(
     Returns:
         Response with the updated incident details.
     """
-    # Determine if incident_id is a number or sys_id
-    incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
-        # This is likely a sys_id
-        api_url = f"{config.api_url}/table/incident/{incident_id}"
-    else:
-        # This is likely an incident number
-        # First, we need to get the sys_id
-        try:
-            query_url = f"{config.api_url}/table/incident"
-            query_params = {
-                "sysparm_query": f"number={incident_id}",
-                "sysparm_limit": 1,
-            }
-
-            response = requests.get(
-                query_url,
-                params=query_params,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            response.raise_for_status()
-
-            result = response.json().get("result", [])
-            if not result:
-                return IncidentResponse(
-                    success=False,
-                    message=f"Incident not found: {incident_id}",
-                )
-
-            incident_id = result[0].get("sys_id")
-            api_url = f"{config.api_url}/table/incident/{incident_id}"
-
-        except requests.RequestException as e:
-            logger.error(f"Failed to find incident: {e}")
-            return IncidentResponse(
-                success=False,
-                message=f"Failed to find incident: {str(e)}",
-            )
+    # Both the lookup and the update use the same auth headers
+    headers = auth_manager.get_headers()
 
     # Build request data
-    data = {}
-
-    if params.short_description:
-        data["short_description"] = params.short_description
-    if params.description:
-        data["description"] = params.description
-    if params.state:
-        data["state"] = params.state
-    if params.category:
-        data["category"] = params.category
-    if params.subcategory:
-        data["subcategory"] = params.subcategory
-    if params.priority:
-        data["priority"] = params.priority
-    if params.impact:
-        data["impact"] = params.impact
-    if params.urgency:
-        data["urgency"] = params.urgency
-    if params.assigned_to:
-        data["assigned_to"] = params.assigned_to
-    if params.assignment_group:
-        data["assignment_group"] = params.assignment_group
-    if params.work_notes:
-        data["work_notes"] = params.work_notes
-    if params.close_notes:
-        data["close_notes"] = params.close_notes
-    if params.close_code:
-        data["close_code"] = params.close_code
+    data = _build_update_data(params)
 
     # Make request
-    try:
-        response = requests.put(
-            api_url,
-            json=data,
-            headers=auth_manager.get_headers(),
-            timeout=config.timeout,
-        )
-        response.raise_for_status()
+    result = _put_incident(config, headers, params.incident_id, data)
+    if isinstance(result, IncidentResponse):
+        return result
 
-        result = response.json().get("result", {})
-
-        return IncidentResponse(
-            success=True,
-            message="Incident updated successfully",
-            incident_id=result.get("sys_id"),
-            incident_number=result.get("number"),
-        )
-
-    except requests.RequestException as e:
-        logger.error(f"Failed to update incident: {e}")
-        return IncidentResponse(
-            success=False,
-            message=f"Failed to update incident: {str(e)}",
-        )
+    return IncidentResponse(
+        success=True,
+        message="Incident updated successfully",
+        incident_id=result.get("sys_id"),
+        incident_number=result.get("number"),
+    )
 
 
+@_handle_request_errors("add comment")
 def add_comment(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -284,48 +588,11 @@ def add_comment(
     Returns:
         Response with the result of the operation.
     """
-    # Determine if incident_id is a number or sys_id
-    incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
-        # This is likely a sys_id
-        api_url = f"{config.api_url}/table/incident/{incident_id}"
-    else:
-        # This is likely an incident number
-        # First, we need to get the sys_id
-        try:
-            query_url = f"{config.api_url}/table/incident"
-            query_params = {
-                "sysparm_query": f"number={incident_id}",
-                "sysparm_limit": 1,
-            }
-
-            response = requests.get(
-                query_url,
-                params=query_params,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            response.raise_for_status()
-
-            result = response.json().get("result", [])
-            if not result:
-                return IncidentResponse(
-                    success=False,
-                    message=f"Incident not found: {incident_id}",
-                )
-
-            incident_id = result[0].get("sys_id")
-            api_url = f"{config.api_url}/table/incident/{incident_id}"
-
-        except requests.RequestException as e:
-            logger.error(f"Failed to find incident: {e}")
-            return IncidentResponse(
-                success=False,
-                message=f"Failed to find incident: {str(e)}",
-            )
+    # Both the lookup and the update use the same auth headers
+    headers = auth_manager.get_headers()
 
     # Build request data
-    data = {}
+    data: Dict[str, str] = {}
 
     if params.is_work_note:
         data["work_notes"] = params.comment
@@ -333,32 +600,19 @@ def add_comment(
         data["comments"] = params.comment
 
     # Make request
-    try:
-        response = requests.put(
-            api_url,
-            json=data,
-            headers=auth_manager.get_headers(),
-            timeout=config.timeout,
-        )
-        response.raise_for_status()
+    result = _put_incident(config, headers, params.incident_id, data)
+    if isinstance(result, IncidentResponse):
+        return result
 
-        result = response.json().get("result", {})
-
-        return IncidentResponse(
-            success=True,
-            message="Comment added successfully",
-            incident_id=result.get("sys_id"),
-            incident_number=result.get("number"),
-        )
-
-    except requests.RequestException as e:
-        logger.error(f"Failed to add comment: {e}")
-        return IncidentResponse(
-            success=False,
-            message=f"Failed to add comment: {str(e)}",
-        )
+    return IncidentResponse(
+        success=True,
+        message="Comment added successfully",
+        incident_id=result.get("sys_id"),
+        incident_number=result.get("number"),
+    )
 
 
+@_handle_request_errors("resolve incident")
 def resolve_incident(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -375,48 +629,11 @@ def resolve_incident(
     Returns:
         Response with the result of the operation.
     """
-    # Determine if incident_id is a number or sys_id
-    incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
-        # This is likely a sys_id
-        api_url = f"{config.api_url}/table/incident/{incident_id}"
-    else:
-        # This is likely an incident number
-        # First, we need to get the sys_id
-        try:
-            query_url = f"{config.api_url}/table/incident"
-            query_params = {
-                "sysparm_query": f"number={incident_id}",
-                "sysparm_limit": 1,
-            }
-
-            response = requests.get(
-                query_url,
-                params=query_params,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            response.raise_for_status()
-
-            result = response.json().get("result", [])
-            if not result:
-                return IncidentResponse(
-                    success=False,
-                    message=f"Incident not found: {incident_id}",
-                )
-
-            incident_id = result[0].get("sys_id")
-            api_url = f"{config.api_url}/table/incident/{incident_id}"
-
-        except requests.RequestException as e:
-            logger.error(f"Failed to find incident: {e}")
-            return IncidentResponse(
-                success=False,
-                message=f"Failed to find incident: {str(e)}",
-            )
+    # Both the lookup and the update use the same auth headers
+    headers = auth_manager.get_headers()
 
     # Build request data
-    data = {
+    data: Dict[str, str] = {
         "state": "6",  # Resolved
         "close_code": params.resolution_code,
         "close_notes": params.resolution_notes,
@@ -424,30 +641,145 @@ def resolve_incident(
     }
 
     # Make request
-    try:
-        response = requests.put(
-            api_url,
-            json=data,
-            headers=auth_manager.get_headers(),
+    result = _put_incident(config, headers, params.incident_id, data)
+    if isinstance(result, IncidentResponse):
+        return result
+
+    return IncidentResponse(
+        success=True,
+        message="Incident resolved successfully",
+        incident_id=result.get("sys_id"),
+        incident_number=result.get("number"),
+    )
+
+
+def _build_incident_query(params: ListIncidentsParams) -> Optional[str]:
+    """
+    Build the encoded sysparm_query for listing incidents.
+
+    Args:
+        params: Parameters for listing incidents.
+
+    Returns:
+        The encoded query, or None if no filters were given.
+    """
+    filters = [
+        f"{column}={value}"
+        for attr, column in _LIST_FILTER_FIELDS
+        if (value := getattr(params, attr))
+    ]
+    if params.query:
+        filters.append(f"short_descriptionLIKE{params.query}^ORdescriptionLIKE{params.query}")
+
+    return "^".join(filters) if filters else None
+
+
+@functools.lru_cache(maxsize=256)
+def _list_incidents_url(api_url: str, sysparm_query: Optional[str]) -> str:
+    """
+    Build the encoded list URL for a filter, without the page window.
+
+    Clients such as dashboards tend to poll with the same filters over and
+    over, so the encoded URL is memoized per filter.
+
+    Args:
+        api_url: Table API URL for incidents.
+        sysparm_query: Encoded incident query, or None for no filter.
+
+    Returns:
+        The list URL with all fixed query parameters encoded.
+    """
+    query_params: Dict[str, Any] = dict(_BASE_LIST_QUERY_PARAMS)
+    if sysparm_query:
+        query_params["sysparm_query"] = sysparm_query
+    return f"{api_url}?{urlencode(query_params)}"
+
+
+def _format_incident(incident_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a raw ServiceNow incident record into the list_incidents shape.
+
+    Args:
+        incident_data: Incident record as returned by the Table API.
+
+    Returns:
+        Dictionary with the incident fields exposed by the tools.
+    """
+    # Handle assigned_to field which could be a string or a dictionary
+    assigned_to = incident_data.get("assigned_to")
+    if isinstance(assigned_to, dict):
+        assigned_to = assigned_to.get("display_value")
+
+    return {
+        "sys_id": incident_data.get("sys_id"),
+        "number": incident_data.get("number"),
+        "short_description": incident_data.get("short_description"),
+        "description": incident_data.get("description"),
+        "state": incident_data.get("state"),
+        "priority": incident_data.get("priority"),
+        "assigned_to": assigned_to,
+        "category": incident_data.get("category"),
+        "subcategory": incident_data.get("subcategory"),
+        "created_on": incident_data.get("sys_created_on"),
+        "updated_on": incident_data.get("sys_updated_on"),
+    }
+
+
+def iter_incidents(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: ListIncidentsParams,
+    page_size: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over incidents from ServiceNow, fetching them one page at a time.
+
+    Up to params.limit incidents are yielded, starting at params.offset. Pages
+    are only requested as the caller consumes them, so callers that stop
+    early never fetch the remaining pages.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for listing incidents.
+        page_size: Number of incidents to request per page. Defaults to
+            params.limit, which fetches everything in a single request.
+
+    Yields:
+        Incidents in the same shape as returned by list_incidents.
+
+    Raises:
+        requests.RequestException: If a page request fails.
+    """
+    api_url = f"{config.api_url}/table/incident"
+    headers = auth_manager.get_headers()
+    page_size = page_size or params.limit
+
+    # Everything except the page window is the same for every page, so the
+    # URL is encoded once up front (and reused across calls with the same
+    # filters).
+    base_url = _list_incidents_url(api_url, _build_incident_query(params))
+
+    remaining = params.limit
+    offset = params.offset
+    while remaining > 0:
+        page_limit = min(page_size, remaining)
+
+        response = _get_session().get(
+            f"{base_url}&sysparm_limit={page_limit}&sysparm_offset={offset}",
+            headers=headers,
             timeout=config.timeout,
         )
         response.raise_for_status()
 
-        result = response.json().get("result", {})
+        records: List[Dict[str, Any]] = _parse_json(response).get("result", [])
+        for incident_data in records:
+            yield _format_incident(incident_data)
 
-        return IncidentResponse(
-            success=True,
-            message="Incident resolved successfully",
-            incident_id=result.get("sys_id"),
-            incident_number=result.get("number"),
-        )
-
-    except requests.RequestException as e:
-        logger.error(f"Failed to resolve incident: {e}")
-        return IncidentResponse(
-            success=False,
-            message=f"Failed to resolve incident: {str(e)}",
-        )
+        if len(records) < page_limit:
+            return
+        offset += len(records)
+        remaining -= len(records)
 
 
 def list_incidents(
@@ -466,70 +798,15 @@ def list_incidents(
     Returns:
         Dictionary with list of incidents.
     """
-    api_url = f"{config.api_url}/table/incident"
-
-    # Build query parameters
-    query_params = {
-        "sysparm_limit": params.limit,
-        "sysparm_offset": params.offset,
-        "sysparm_display_value": "true",
-        "sysparm_exclude_reference_link": "true",
-    }
-    
-    # Add filters
-    filters = []
-    if params.state:
-        filters.append(f"state={params.state}")
-    if params.assigned_to:
-        filters.append(f"assigned_to={params.assigned_to}")
-    if params.category:
-        filters.append(f"category={params.category}")
-    if params.query:
-        filters.append(f"short_descriptionLIKE{params.query}^ORdescriptionLIKE{params.query}")
-    
-    if filters:
-        query_params["sysparm_query"] = "^".join(filters)
-    
-    # Make request
     try:
-        response = requests.get(
-            api_url,
-            params=query_params,
-            headers=auth_manager.get_headers(),
-            timeout=config.timeout,
-        )
-        response.raise_for_status()
-        
-        data = response.json()
-        incidents = []
-        
-        for incident_data in data.get("result", []):
-            # Handle assigned_to field which could be a string or a dictionary
-            assigned_to = incident_data.get("assigned_to")
-            if isinstance(assigned_to, dict):
-                assigned_to = assigned_to.get("display_value")
-            
-            incident = {
-                "sys_id": incident_data.get("sys_id"),
-                "number": incident_data.get("number"),
-                "short_description": incident_data.get("short_description"),
-                "description": incident_data.get("description"),
-                "state": incident_data.get("state"),
-                "priority": incident_data.get("priority"),
-                "assigned_to": assigned_to,
-                "category": incident_data.get("category"),
-                "subcategory": incident_data.get("subcategory"),
-                "created_on": incident_data.get("sys_created_on"),
-                "updated_on": incident_data.get("sys_updated_on"),
-            }
-            incidents.append(incident)
-        
+        incidents = list(iter_incidents(config, auth_manager, params))
+
         return {
             "success": True,
             "message": f"Found {len(incidents)} incidents",
             "incidents": incidents
         }
-        
+
     except requests.RequestException as e:
         logger.error(f"Failed to list incidents: {e}")
         return {
@@ -537,3 +814,192 @@ def list_incidents(
             "message": f"Failed to list incidents: {str(e)}",
             "incidents": []
         }
+
+
+def _decode_batch_body(body: Optional[str]) -> Dict[str, Any]:
+    """
+    Decode the base64 JSON body of a batch sub-response.
+
+    Raises:
+        ValueError: If the body is not base64-encoded JSON.
+    """
+    if not body:
+        return {}
+    result = from_json(base64.b64decode(body, validate=True))
+    return result if isinstance(result, dict) else {}
+
+
+def batch_update_incidents(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: BatchUpdateIncidentsParams,
+) -> dict:
+    """
+    Update several incidents in ServiceNow with as few round trips as possible.
+
+    Incident numbers are resolved to sys_ids with a single query, and all
+    updates are then sent together through the ServiceNow Batch API.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for updating the incidents.
+
+    Returns:
+        Dictionary with one result per requested update, in request order.
+    """
+    headers = auth_manager.get_headers()
+    updates = params.updates
+    results: List[Optional[IncidentResponse]] = [None] * len(updates)
+
+    # Resolve uncached incident numbers with a few numberIN queries. Numbers are
+    # matched case-insensitively, so key them upper-cased like ServiceNow returns them.
+    sys_ids: Dict[str, str] = {}
+    numbers: Dict[str, None] = {}
+    for update in updates:
+        if _is_sys_id(update.incident_id):
+            continue
+        number = update.incident_id.upper()
+        if number in sys_ids or number in numbers:
+            continue
+        cached = _get_cached_sys_id(config.api_url, number)
+        if cached:
+            sys_ids[number] = cached
+        else:
+            numbers[number] = None
+
+    pending = list(numbers)
+    try:
+        for start in range(0, len(pending), _BATCH_LOOKUP_SIZE):
+            chunk = pending[start : start + _BATCH_LOOKUP_SIZE]
+            query_params: Dict[str, Any] = {
+                "sysparm_query": f"numberIN{','.join(chunk)}",
+                "sysparm_fields": "sys_id,number",
+                "sysparm_exclude_reference_link": "true",
+                "sysparm_limit": len(chunk),
+            }
+
+            response = _get_session().get(
+                f"{config.api_url}/table/incident",
+                params=query_params,
+                headers=headers,
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+
+            for record in _parse_json(response).get("result", []):
+                number, sys_id = record.get("number"), record.get("sys_id")
+                if number and sys_id:
+                    sys_ids[number.upper()] = sys_id
+                    _cache_sys_id(config.api_url, number, sys_id)
+
+    except requests.RequestException as e:
+        logger.error(f"Failed to find incidents: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to find incidents: {str(e)}",
+            "results": [],
+        }
+
+    # Build one batch sub-request per resolvable update
+    rest_requests: List[Dict[str, Any]] = []
+    for index, update in enumerate(updates):
+        if _is_sys_id(update.incident_id):
+            sys_id = update.incident_id
+        else:
+            sys_id = sys_ids.get(update.incident_id.upper())
+        if not sys_id:
+            results[index] = IncidentResponse(
+                success=False,
+                message=f"Incident not found: {update.incident_id}",
+            )
+            continue
+
+        body = json.dumps(_build_update_data(update)).encode()
+        rest_requests.append(
+            {
+                "id": str(index),
+                "method": "PUT",
+                "url": f"/api/now/table/incident/{sys_id}",
+                "headers": _BATCH_HEADERS,
+                "body": base64.b64encode(body).decode(),
+            }
+        )
+
+    # Make request
+    if rest_requests:
+        try:
+            response = _get_session().post(
+                f"{config.api_url}/v1/batch",
+                json={"batch_request_id": str(uuid.uuid4()), "rest_requests": rest_requests},
+                headers=headers,
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+
+            serviced_requests = _parse_json(response).get("serviced_requests", [])
+
+        except requests.RequestException as e:
+            logger.error(f"Failed to update incidents: {e}")
+            return {
+                "success": False,
+                "message": f"Failed to update incidents: {str(e)}",
+                "results": [],
+            }
+
+        for serviced in serviced_requests:
+            # Ids we did not send are left to the "not serviced" fallback below
+            try:
+                index = int(serviced.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < len(updates):
+                continue
+            status_code = serviced.get("status_code", 0)
+            try:
+                result = _decode_batch_body(serviced.get("body"))
+            except ValueError as e:
+                logger.error(f"Failed to decode batch response {index}: {e}")
+                results[index] = IncidentResponse(
+                    success=False,
+                    message=f"Failed to update incident: HTTP {status_code}",
+                )
+                continue
+
+            if 200 <= status_code < 300:
+                record = result.get("result")
+                if not isinstance(record, dict):
+                    record = {}
+                results[index] = IncidentResponse(
+                    success=True,
+                    message="Incident updated successfully",
+                    incident_id=record.get("sys_id"),
+                    incident_number=record.get("number"),
+                )
+            else:
+                update = updates[index]
+                if status_code == 404 and not _is_sys_id(update.incident_id):
+                    _evict_sys_id(config.api_url, update.incident_id)
+                error = result.get("error")
+                if isinstance(error, dict):
+                    error = error.get("message")
+                results[index] = IncidentResponse(
+                    success=False,
+                    message=f"Failed to update incident: {error or f'HTTP {status_code}'}",
+                )
+
+    responses = [
+        item
+        or IncidentResponse(
+            success=False,
+            message="Failed to update incident: request was not serviced",
+        )
+        for item in results
+    ]
+    updated = sum(1 for item in responses if item.success)
+
+    return {
+        "success": updated == len(responses),
+        "message": f"Updated {updated} of {len(responses)} incidents",
+        "results": [item.model_dump() for item in responses],
+    }
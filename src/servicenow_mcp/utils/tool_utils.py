@@ -118,6 +118,7 @@ from servicenow_mcp.tools.changeset_tools import (
 )
 from servicenow_mcp.tools.incident_tools import (
     AddCommentParams,
+    BatchUpdateIncidentsParams,
     CreateIncidentParams,
     ListIncidentsParams,
     ResolveIncidentParams,
@@ -126,6 +127,9 @@ from servicenow_mcp.tools.incident_tools import (
 from servicenow_mcp.tools.incident_tools import (
     add_comment as add_comment_tool,
 )
+from servicenow_mcp.tools.incident_tools import (
+    batch_update_incidents as batch_update_incidents_tool,
+)
 from servicenow_mcp.tools.incident_tools import (
     create_incident as create_incident_tool,
 )
@@ -396,6 +400,13 @@ def get_tool_definitions(
             "List incidents from ServiceNow",
             "json",  # Tool returns list/dict, needs JSON dump
         ),
+        "batch_update_incidents": (
+            batch_update_incidents_tool,
+            BatchUpdateIncidentsParams,
+            str,  # Expects JSON string
+            "Update several incidents in ServiceNow in a single batch request",
+            "json",  # Tool returns dict, needs JSON dump
+        ),
         # Catalog Tools
         "list_catalog_items": (
             list_catalog_items_tool,
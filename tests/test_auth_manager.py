@@ -0,0 +1,54 @@
+"""
+Tests for the authentication manager.
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.config import AuthConfig, AuthType, OAuthConfig
+
+
+class TestAuthManager(unittest.TestCase):
+    """Tests for the AuthManager class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.auth_manager = AuthManager(
+            AuthConfig(
+                type=AuthType.OAUTH,
+                oauth=OAuthConfig(client_id="client", client_secret="secret"),
+            ),
+            "https://test.service-now.com",
+        )
+
+    @patch("servicenow_mcp.auth.auth_manager.requests.post")
+    def test_concurrent_get_headers_fetch_one_token(self, mock_post):
+        """Test that concurrent first calls share a single OAuth token request."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def token_response(*args, **kwargs):
+            # Give the other threads time to reach the token check
+            time.sleep(0.05)
+            response = MagicMock(status_code=200, text="")
+            response.json.return_value = {"access_token": "token", "token_type": "Bearer"}
+            return response
+
+        mock_post.side_effect = token_response
+
+        def get_headers():
+            barrier.wait()
+            return self.auth_manager.get_headers()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            headers = list(executor.map(lambda _: get_headers(), range(4)))
+
+        mock_post.assert_called_once()
+        self.assertEqual({h["Authorization"] for h in headers}, {"Bearer token"})
+
+
+if __name__ == "__main__":
+    unittest.main()
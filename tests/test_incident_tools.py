@@ -0,0 +1,605 @@
+"""
+Tests for the incident tools.
+"""
+
+import base64
+import json
+import unittest
+from http.client import HTTPMessage
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.cookies import extract_cookies_to_jar
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools import incident_tools
+from servicenow_mcp.tools.incident_tools import (
+    AddCommentParams,
+    BatchUpdateIncidentsParams,
+    CreateIncidentParams,
+    ListIncidentsParams,
+    ResolveIncidentParams,
+    UpdateIncidentParams,
+    add_comment,
+    batch_update_incidents,
+    create_incident,
+    iter_incidents,
+    list_incidents,
+    resolve_incident,
+    update_incident,
+)
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+
+SYS_ID = "0123456789abcdef0123456789abcdef"
+
+
+def _query_of(call):
+    """Get the decoded query string parameters of a mocked request call."""
+    args, _ = call
+    return {key: values[0] for key, values in parse_qs(urlsplit(args[0]).query).items()}
+
+
+def _mock_response(payload):
+    """Create a mock response returning the given JSON payload."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+class TestIncidentSession(unittest.TestCase):
+    """Tests for the shared incident HTTP session."""
+
+    @patch.object(incident_tools, "_session", None)
+    def test_get_session_is_shared(self):
+        """Test that the HTTP session is created once and reused."""
+        session = incident_tools._get_session()
+
+        self.assertIs(incident_tools._get_session(), session)
+        adapter = session.get_adapter("https://test.service-now.com")
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    @patch.object(incident_tools, "_session", None)
+    def test_get_session_ignores_retry_after(self):
+        """Test that retries never sleep for a server-supplied Retry-After."""
+        session = incident_tools._get_session()
+
+        retry = session.get_adapter("https://test.service-now.com").max_retries
+        self.assertFalse(retry.respect_retry_after_header)
+
+    @patch.object(incident_tools, "_session", None)
+    def test_get_session_only_retries_reads(self):
+        """Test that writes are never resent, since journal fields would duplicate."""
+        session = incident_tools._get_session()
+
+        retry = session.get_adapter("https://test.service-now.com").max_retries
+        self.assertTrue(retry.is_retry("GET", 502))
+        for method in ("POST", "PUT", "PATCH"):
+            self.assertFalse(retry.is_retry(method, 502))
+
+    @patch.object(incident_tools, "_session", None)
+    def test_get_session_does_not_keep_cookies(self):
+        """Test that ServiceNow session cookies are not stored for later calls."""
+        session = incident_tools._get_session()
+        request = requests.Request("GET", "https://test.service-now.com/api/now/table/incident")
+        headers = HTTPMessage()
+        headers["Set-Cookie"] = "JSESSIONID=abc123; Path=/"
+        raw = MagicMock()
+        raw._original_response.msg = headers
+
+        extract_cookies_to_jar(session.cookies, request.prepare(), raw)
+
+        self.assertEqual(len(session.cookies), 0)
+
+
+class TestIncidentFields(unittest.TestCase):
+    """Tests for the incident field tables."""
+
+    def test_fields_match_params(self):
+        """Test that every writable parameter is sent in the request body."""
+        self.assertEqual(set(incident_tools._CREATE_FIELDS), set(CreateIncidentParams.model_fields))
+        self.assertEqual(
+            set(incident_tools._UPDATE_FIELDS),
+            set(UpdateIncidentParams.model_fields) - {"incident_id"},
+        )
+
+
+class TestIsSysId(unittest.TestCase):
+    """Tests for sys_id detection."""
+
+    def test_is_sys_id(self):
+        """Test that only 32 lowercase hex characters are treated as a sys_id."""
+        self.assertTrue(incident_tools._is_sys_id(SYS_ID))
+        self.assertFalse(incident_tools._is_sys_id("INC0010001"))
+        self.assertFalse(incident_tools._is_sys_id(SYS_ID.upper()))
+        self.assertFalse(incident_tools._is_sys_id(SYS_ID + "0"))
+        self.assertFalse(incident_tools._is_sys_id(SYS_ID + "\n"))
+
+
+class TestIncidentTools(unittest.TestCase):
+    """Tests for the incident tools."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = ServerConfig(
+            instance_url="https://test.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC,
+                basic=BasicAuthConfig(username="test_user", password="test_password"),
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+        self.auth_manager.get_headers = MagicMock(return_value={"Authorization": "Basic dGVzdA=="})
+
+        patcher = patch("servicenow_mcp.tools.incident_tools._get_session")
+        self.mock_session = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        incident_tools._sys_id_cache.clear()
+        self.addCleanup(incident_tools._sys_id_cache.clear)
+
+    def test_create_incident(self):
+        """Test creating an incident."""
+        self.mock_session.post.return_value = _mock_response(
+            {"result": {"sys_id": SYS_ID, "number": "INC0010001"}}
+        )
+
+        result = create_incident(
+            self.config,
+            self.auth_manager,
+            CreateIncidentParams(short_description="Printer on fire", urgency="1"),
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.incident_id, SYS_ID)
+        self.assertEqual(result.incident_number, "INC0010001")
+        _, kwargs = self.mock_session.post.call_args
+        self.assertEqual(kwargs["json"], {"short_description": "Printer on fire", "urgency": "1"})
+
+    def test_create_incident_error(self):
+        """Test that request errors are reported as a failed response."""
+        self.mock_session.post.side_effect = requests.RequestException("boom")
+
+        result = create_incident(
+            self.config,
+            self.auth_manager,
+            CreateIncidentParams(short_description="Printer on fire"),
+        )
+
+        self.assertFalse(result.success)
+        self.assertIn("boom", result.message)
+
+    def test_update_incident_by_sys_id(self):
+        """Test updating an incident by sys_id skips the number lookup."""
+        self.mock_session.put.return_value = _mock_response(
+            {"result": {"sys_id": SYS_ID, "number": "INC0010001"}}
+        )
+
+        result = update_incident(
+            self.config,
+            self.auth_manager,
+            UpdateIncidentParams(incident_id=SYS_ID, state="2"),
+        )
+
+        self.assertTrue(result.success)
+        self.mock_session.get.assert_not_called()
+        args, kwargs = self.mock_session.put.call_args
+        self.assertEqual(args[0], f"{self.config.api_url}/table/incident/{SYS_ID}")
+        self.assertEqual(kwargs["json"], {"state": "2"})
+
+    def test_update_incident_sends_empty_strings(self):
+        """Test that explicitly empty fields are sent so they can be cleared."""
+        self.mock_session.put.return_value = _mock_response(
+            {"result": {"sys_id": SYS_ID, "number": "INC0010001"}}
+        )
+
+        update_incident(
+            self.config,
+            self.auth_manager,
+            UpdateIncidentParams(incident_id=SYS_ID, assigned_to="", urgency="2"),
+        )
+
+        _, kwargs = self.mock_session.put.call_args
+        self.assertEqual(kwargs["json"], {"assigned_to": "", "urgency": "2"})
+
+    def test_update_incident_by_number(self):
+        """Test updating an incident by number resolves the sys_id first."""
+        self.mock_session.get.return_value = _mock_response({"result": [{"sys_id": SYS_ID}]})
+        self.mock_session.put.return_value = _mock_response(
+            {"result": {"sys_id": SYS_ID, "number": "INC0010001"}}
+        )
+
+        result = update_incident(
+            self.config,
+            self.auth_manager,
+            UpdateIncidentParams(incident_id="INC0010001", priority="1"),
+        )
+
+        self.assertTrue(result.success)
+        self.auth_manager.get_headers.assert_called_once()
+        self.mock_session.get.assert_called_once()
+        _, kwargs = self.mock_session.get.call_args
+        self.assertEqual(kwargs["params"]["sysparm_query"], "number=INC0010001")
+        self.assertEqual(kwargs["params"]["sysparm_fields"], "sys_id")
+        args, _ = self.mock_session.put.call_args
+        self.assertEqual(args[0], f"{self.config.api_url}/table/incident/{SYS_ID}")
+
+    def test_resolve_sys_id_is_cached(self):
+        """Test that repeated operations on the same number only look it up once."""
+        self.mock_session.get.return_value = _mock_response({"result": [{"sys_id": SYS_ID}]})
+        self.mock_session.put.return_value = _mock_response(
+            {"result": {"sys_id": SYS_ID, "number": "INC0010001"}}
+        )
+
+        add_comment(
+            self.config,
+            self.auth_manager,
+            AddCommentParams(incident_id="INC0010001", comment="Looking into it"),
+        )
+        result = resolve_incident(
+            self.config,
+            self.auth_manager,
+            ResolveIncidentParams(
+                incident_id="INC0010001",
+                resolution_code="Solved (Permanently)",
+                resolution_notes="Rebooted",
+            ),
+        )
+
+        self.assertTrue(result.success)
+        self.mock_session.get.assert_called_once()
+        self.assertEqual(self.mock_session.put.call_count, 2)
+
+    def test_resolve_sys_id_expires(self):
+        """Test that expired cache entries are looked up again."""
+        self.mock_session.get.return_value = _mock_response({"result": [{"sys_id": SYS_ID}]})
+
+        with patch("servicenow_mcp.tools.incident_tools.time.monotonic", return_value=0):
+            incident_tools._resolve_sys_id(self.config, {}, "INC0010001")
+        with patch("servicenow_mcp.tools.incident_tools.time.monotonic", return_value=1000):
+            sys_id = incident_tools._resolve_sys_id(self.config, {}, "INC0010001")
+
+        self.assertEqual(sys_id, SYS_ID)
+        self.assertEqual(self.mock_session.get.call_count, 2)
+
+    def test_stale_cached_sys_id_is_looked_up_again(self):
+        """Test that a 404 for a cached number drops the entry and retries once."""
+        new_sys_id = "fedcba9876543210fedcba9876543210"
+        incident_tools._cache_sys_id(self.config.api_url, "INC0010001", SYS_ID)
+        self.mock_session.get.return_value = _mock_response({"result": [{"sys_id": new_sys_id}]})
+        not_found = _mock_response({"error": {"message": "No Record found"}})
+        not_found.status_code = 404
+        self.mock_session.put.side_effect = [
+            not_found,
+            _mock_response({"result": {"sys_id": new_sys_id, "number": "INC0010001"}}),
+        ]
+
+        result = add_comment(
+            self.config,
+            self.auth_manager,
+            AddCommentParams(incident_id="INC0010001", comment="Looking into it"),
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.incident_id, new_sys_id)
+        self.mock_session.get.assert_called_once()
+        self.assertEqual(
+            [args[0] for args, _ in self.mock_session.put.call_args_list],
+            [
+                f"{self.config.api_url}/table/incident/{SYS_ID}",
+                f"{self.config.api_url}/table/incident/{new_sys_id}",
+            ],
+        )
+        self.assertEqual(
+            incident_tools._get_cached_sys_id(self.config.api_url, "INC0010001"), new_sys_id
+        )
+
+    def test_update_incident_error(self):
+        """Test that a failed update is reported with the update message."""
+        self.mock_session.put.side_effect = requests.HTTPError("503 Server Error")
+
+        result = update_incident(
+            self.config,
+            self.auth_manager,
+            UpdateIncidentParams(incident_id=SYS_ID, state="2"),
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.message, "Failed to update incident: 503 Server Error")
+
+    def test_add_comment_not_found(self):
+        """Test adding a comment to an unknown incident number."""
+        self.mock_session.get.return_value = _mock_response({"result": []})
+
+        result = add_comment(
+            self.config,
+            self.auth_manager,
+            AddCommentParams(incident_id="INC0099999", comment="Hello"),
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.message, "Incident not found: INC0099999")
+        self.mock_session.put.assert_not_called()
+
+    def test_add_work_note(self):
+        """Test adding a work note sends the work_notes field."""
+        self.mock_session.put.return_value = _mock_response(
+            {"result": {"sys_id": SYS_ID, "number": "INC0010001"}}
+        )
+
+        result = add_comment(
+            self.config,
+            self.auth_manager,
+            AddCommentParams(incident_id=SYS_ID, comment="Internal", is_work_note=True),
+        )
+
+        self.assertTrue(result.success)
+        _, kwargs = self.mock_session.put.call_args
+        self.assertEqual(kwargs["json"], {"work_notes": "Internal"})
+
+    def test_resolve_incident(self):
+        """Test resolving an incident."""
+        self.mock_session.put.return_value = _mock_response(
+            {"result": {"sys_id": SYS_ID, "number": "INC0010001"}}
+        )
+
+        result = resolve_incident(
+            self.config,
+            self.auth_manager,
+            ResolveIncidentParams(
+                incident_id=SYS_ID,
+                resolution_code="Solved (Permanently)",
+                resolution_notes="Rebooted",
+            ),
+        )
+
+        self.assertTrue(result.success)
+        _, kwargs = self.mock_session.put.call_args
+        self.assertEqual(kwargs["json"]["state"], "6")
+        self.assertEqual(kwargs["json"]["close_code"], "Solved (Permanently)")
+
+    def test_list_incidents(self):
+        """Test listing incidents with filters."""
+        self.mock_session.get.return_value = _mock_response(
+            {
+                "result": [
+                    {
+                        "sys_id": SYS_ID,
+                        "number": "INC0010001",
+                        "short_description": "Printer on fire",
+                        "state": "New",
+                        "assigned_to": {"display_value": "Beth Anglin"},
+                        "sys_created_on": "2025-01-01 10:00:00",
+                    }
+                ]
+            }
+        )
+
+        result = list_incidents(
+            self.config,
+            self.auth_manager,
+            ListIncidentsParams(limit=5, state="1", query="printer"),
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(len(result["incidents"]), 1)
+        incident = result["incidents"][0]
+        self.assertEqual(incident["assigned_to"], "Beth Anglin")
+        self.assertEqual(incident["created_on"], "2025-01-01 10:00:00")
+        query = _query_of(self.mock_session.get.call_args)
+        self.assertEqual(
+            query["sysparm_query"],
+            "state=1^short_descriptionLIKEprinter^ORdescriptionLIKEprinter",
+        )
+        self.assertEqual(query["sysparm_limit"], "5")
+
+    def test_invalid_json_is_reported(self):
+        """Test that an unparseable response body is reported as a failed response."""
+        response = _mock_response({})
+        response.content = b"<html>Instance hibernating</html>"
+        self.mock_session.post.return_value = response
+
+        result = create_incident(
+            self.config,
+            self.auth_manager,
+            CreateIncidentParams(short_description="Printer on fire"),
+        )
+
+        self.assertFalse(result.success)
+        self.assertTrue(result.message.startswith("Failed to create incident"))
+
+    def test_list_incidents_without_filters(self):
+        """Test that no sysparm_query is sent when no filters are given."""
+        self.mock_session.get.return_value = _mock_response({"result": []})
+
+        list_incidents(self.config, self.auth_manager, ListIncidentsParams())
+
+        query = _query_of(self.mock_session.get.call_args)
+        self.assertNotIn("sysparm_query", query)
+        self.assertEqual(query["sysparm_display_value"], "true")
+        self.assertIn("sys_created_on", query["sysparm_fields"].split(","))
+
+    def test_list_incidents_url_is_reused(self):
+        """Test that repeated listings with the same filters reuse the encoded URL."""
+        self.mock_session.get.return_value = _mock_response({"result": []})
+        incident_tools._list_incidents_url.cache_clear()
+
+        for _ in range(3):
+            list_incidents(self.config, self.auth_manager, ListIncidentsParams(state="2"))
+        list_incidents(self.config, self.auth_manager, ListIncidentsParams(state="3"))
+
+        cache_info = incident_tools._list_incidents_url.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (2, 2))
+        self.assertEqual(_query_of(self.mock_session.get.call_args)["sysparm_query"], "state=3")
+
+    def test_iter_incidents_pages_lazily(self):
+        """Test that iter_incidents fetches pages only as they are consumed."""
+        self.mock_session.get.side_effect = [
+            _mock_response({"result": [{"number": "INC0010001"}, {"number": "INC0010002"}]}),
+            _mock_response({"result": [{"number": "INC0010003"}]}),
+        ]
+
+        incidents = iter_incidents(
+            self.config, self.auth_manager, ListIncidentsParams(limit=4, offset=10), page_size=2
+        )
+
+        self.assertEqual(next(incidents)["number"], "INC0010001")
+        self.assertEqual(self.mock_session.get.call_count, 1)
+        self.assertEqual([i["number"] for i in incidents], ["INC0010002", "INC0010003"])
+        self.assertEqual(self.mock_session.get.call_count, 2)
+        query = _query_of(self.mock_session.get.call_args)
+        self.assertEqual(query["sysparm_offset"], "12")
+        self.assertEqual(query["sysparm_limit"], "2")
+
+    def test_list_incidents_error(self):
+        """Test that list errors return an empty result."""
+        self.mock_session.get.side_effect = requests.RequestException("timeout")
+
+        result = list_incidents(self.config, self.auth_manager, ListIncidentsParams())
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["incidents"], [])
+
+    def test_batch_update_incidents(self):
+        """Test that batch updates resolve numbers once and send a single batch request."""
+        other_sys_id = "fedcba9876543210fedcba9876543210"
+        self.mock_session.get.return_value = _mock_response(
+            {"result": [{"sys_id": other_sys_id, "number": "INC0010002"}]}
+        )
+        updated = base64.b64encode(
+            json.dumps({"result": {"sys_id": SYS_ID, "number": "INC0010001"}}).encode()
+        ).decode()
+        self.mock_session.post.return_value = _mock_response(
+            {
+                "serviced_requests": [
+                    {"id": "0", "status_code": 200, "body": updated},
+                    {"id": "1", "status_code": 403, "body": ""},
+                    {"id": "3", "status_code": 200, "body": updated},
+                ]
+            }
+        )
+
+        result = batch_update_incidents(
+            self.config,
+            self.auth_manager,
+            BatchUpdateIncidentsParams(
+                updates=[
+                    UpdateIncidentParams(incident_id=SYS_ID, state="2"),
+                    UpdateIncidentParams(incident_id="inc0010002", state="2"),
+                    UpdateIncidentParams(incident_id="INC0099999", state="2"),
+                    UpdateIncidentParams(incident_id="INC0010002", state="3"),
+                ]
+            ),
+        )
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["message"], "Updated 2 of 4 incidents")
+        self.assertEqual([r["success"] for r in result["results"]], [True, False, False, True])
+        self.assertEqual(result["results"][2]["message"], "Incident not found: INC0099999")
+
+        _, kwargs = self.mock_session.get.call_args
+        self.assertEqual(kwargs["params"]["sysparm_query"], "numberININC0010002,INC0099999")
+        self.mock_session.post.assert_called_once()
+        args, kwargs = self.mock_session.post.call_args
+        self.assertEqual(args[0], f"{self.config.api_url}/v1/batch")
+        rest_requests = kwargs["json"]["rest_requests"]
+        self.assertEqual(
+            [r["url"] for r in rest_requests],
+            [
+                f"/api/now/table/incident/{SYS_ID}",
+                f"/api/now/table/incident/{other_sys_id}",
+                f"/api/now/table/incident/{other_sys_id}",
+            ],
+        )
+        self.assertEqual(json.loads(base64.b64decode(rest_requests[0]["body"])), {"state": "2"})
+
+    def test_batch_update_incidents_bad_sub_response(self):
+        """Test that undecodable or unexpected sub-responses fail only their own update."""
+        html = base64.b64encode(b"<html><body>Forbidden</body></html>").decode()
+        forbidden = base64.b64encode(json.dumps({"error": "Forbidden"}).encode()).decode()
+        self.mock_session.post.return_value = _mock_response(
+            {
+                "serviced_requests": [
+                    {"id": "0", "status_code": 403, "body": html},
+                    {"id": "1", "status_code": 403, "body": forbidden},
+                    {"id": "2", "status_code": 502, "body": "not base64!"},
+                ]
+            }
+        )
+
+        result = batch_update_incidents(
+            self.config,
+            self.auth_manager,
+            BatchUpdateIncidentsParams(
+                updates=[UpdateIncidentParams(incident_id=SYS_ID, state="2")] * 3
+            ),
+        )
+
+        self.assertFalse(result["success"])
+        self.assertEqual(
+            [r["message"] for r in result["results"]],
+            [
+                "Failed to update incident: HTTP 403",
+                "Failed to update incident: Forbidden",
+                "Failed to update incident: HTTP 502",
+            ],
+        )
+
+    def test_batch_update_incidents_ignores_unknown_ids(self):
+        """Test that sub-responses with ids we did not send are not applied."""
+        updated = base64.b64encode(
+            json.dumps({"result": {"sys_id": SYS_ID, "number": "INC0010001"}}).encode()
+        ).decode()
+        self.mock_session.post.return_value = _mock_response(
+            {
+                "serviced_requests": [
+                    {"status_code": 200, "body": updated},
+                    {"id": "first", "status_code": 200, "body": updated},
+                    {"id": "7", "status_code": 200, "body": updated},
+                    {"id": "-1", "status_code": 200, "body": updated},
+                    {"id": "0", "status_code": 200, "body": updated},
+                ]
+            }
+        )
+
+        result = batch_update_incidents(
+            self.config,
+            self.auth_manager,
+            BatchUpdateIncidentsParams(
+                updates=[UpdateIncidentParams(incident_id=SYS_ID, state="2")] * 2
+            ),
+        )
+
+        self.assertEqual(result["message"], "Updated 1 of 2 incidents")
+        self.assertEqual(
+            result["results"][1]["message"],
+            "Failed to update incident: request was not serviced",
+        )
+
+    def test_batch_update_incidents_chunks_number_lookup(self):
+        """Test that large batches resolve their numbers over several lookups."""
+        numbers = [f"INC{i:07d}" for i in range(incident_tools._BATCH_LOOKUP_SIZE + 1)]
+        self.mock_session.get.return_value = _mock_response({"result": []})
+
+        result = batch_update_incidents(
+            self.config,
+            self.auth_manager,
+            BatchUpdateIncidentsParams(
+                updates=[UpdateIncidentParams(incident_id=n, state="2") for n in numbers]
+            ),
+        )
+
+        self.assertFalse(result["success"])
+        queries = [
+            kwargs["params"]["sysparm_query"] for _, kwargs in self.mock_session.get.call_args_list
+        ]
+        self.assertEqual(
+            queries,
+            [f"numberIN{','.join(numbers[:-1])}", f"numberIN{numbers[-1]}"],
+        )
+        self.mock_session.post.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for the ServiceNow MCP server incident tool dispatch.
+"""
+
+import asyncio
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+
+
+class TestServerIncident(unittest.TestCase):
+    """Tests for dispatching incident tools through the MCP server."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.server_config = ServerConfig(
+            instance_url="https://test.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC,
+                basic=BasicAuthConfig(username="test_user", password="test_password"),
+            ),
+        )
+        with patch.dict("os.environ", {"MCP_TOOL_PACKAGE": "service_desk"}):
+            self.server = ServiceNowMCP(self.server_config)
+
+    def _replace_tool(self, name, impl):
+        """Swap the implementation of a registered tool."""
+        definition = self.server.tool_definitions[name]
+        _impl, params_model, return_type, description, serialization = definition
+        self.server.tool_definitions[name] = (
+            impl,
+            params_model,
+            return_type,
+            description,
+            serialization,
+        )
+
+    def test_call_tool_runs_off_the_event_loop(self):
+        """Test that tool implementations run on a worker thread."""
+        threads = []
+
+        def fake_list_incidents(config, auth_manager, params):
+            threads.append(threading.current_thread())
+            return {"success": True, "message": "Found 0 incidents", "incidents": []}
+
+        self._replace_tool("list_incidents", fake_list_incidents)
+
+        result = asyncio.run(self.server._call_tool_impl("list_incidents", {"limit": 5}))
+
+        self.assertEqual(json.loads(result[0].text)["incidents"], [])
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_call_tool_overlaps_calls(self):
+        """Test that concurrent tool calls are in flight at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_list_incidents(config, auth_manager, params):
+            # Only returns if both calls are running at once
+            barrier.wait()
+            return {"success": True, "message": "Found 0 incidents", "incidents": []}
+
+        self._replace_tool("list_incidents", fake_list_incidents)
+
+        async def call_twice():
+            return await asyncio.gather(
+                self.server._call_tool_impl("list_incidents", {}),
+                self.server._call_tool_impl("list_incidents", {}),
+            )
+
+        results = asyncio.run(call_twice())
+
+        self.assertEqual(len(results), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()